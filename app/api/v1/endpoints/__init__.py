@@ -1,4 +1,4 @@
 """API v1 endpoints package."""
-from app.api.v1.endpoints import health, contact
+from app.api.v1.endpoints import health, contact, stats
 
-__all__ = ["health", "contact"]
+__all__ = ["health", "contact", "stats"]
@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException
 
 from app.schemas.contact import ContactRequest, ContactResponse
 from app.services.email import email_service
+from app.services.stats import stats_service
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,6 +40,7 @@ async def send_contact_email(contact: ContactRequest):
         
         # Send email
         email_service.send_email(contact_data)
+        stats_service.record_submission(contact.email, success=True)
         
         return ContactResponse(
             success=True,
@@ -47,6 +49,7 @@ async def send_contact_email(contact: ContactRequest):
         
     except Exception as e:
         logger.error(f"Error processing contact form: {e}")
+        stats_service.record_submission(contact.email, success=False)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to send your message. Please try again later. Error: {str(e)}"
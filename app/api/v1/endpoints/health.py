@@ -17,7 +17,8 @@ async def root():
         "status": "running",
         "endpoints": {
             "health": "/health",
-            "contact": "/api/v1/contact (POST)"
+            "contact": "/api/v1/contact (POST)",
+            "stats": "/api/v1/stats (GET)"
         }
     }
 
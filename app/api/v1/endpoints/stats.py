@@ -0,0 +1,55 @@
+"""
+Submission statistics endpoints.
+"""
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi.security import APIKeyHeader
+
+from app.core.config import settings
+from app.schemas.stats import StatsResponse
+from app.services.stats import stats_service
+
+router = APIRouter()
+
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+def require_stats_key(api_key: Optional[str] = Security(api_key_header)) -> None:
+    """
+    Verify the stats API key.
+    
+    Raises:
+        HTTPException: 503 if no key is configured, 401 if the key is wrong
+    """
+    if not settings.stats_api_key:
+        raise HTTPException(
+            status_code=503,
+            detail="Stats endpoint is not configured"
+        )
+    # Compare bytes: Starlette decodes headers as latin-1, so re-encoding
+    # with latin-1 recovers exactly what the client sent. compare_digest
+    # also rejects str arguments containing non-ASCII characters.
+    if api_key is None or not secrets.compare_digest(
+        api_key.encode("latin-1"), settings.stats_api_key.encode("utf-8")
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing API key"
+        )
+
+
+@router.get(
+    "/stats",
+    response_model=StatsResponse,
+    dependencies=[Depends(require_stats_key)]
+)
+async def get_stats():
+    """
+    Return contact form submission statistics.
+    
+    Returns:
+        StatsResponse with windowed counts, outcomes, top domains and latency
+    """
+    return stats_service.snapshot()
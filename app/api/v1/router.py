@@ -4,7 +4,7 @@ Includes all v1 endpoints.
 """
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import contact
+from app.api.v1.endpoints import contact, stats
 
 api_router = APIRouter()
 
@@ -13,3 +13,9 @@ api_router.include_router(
     contact.router,
     tags=["contact"]
 )
+
+# Include stats endpoints
+api_router.include_router(
+    stats.router,
+    tags=["stats"]
+)
@@ -32,6 +32,15 @@ class Settings(BaseSettings):
     # CORS configuration
     allowed_origins: str = "*"
     
+    # Stats endpoint API key (endpoint disabled when empty)
+    stats_api_key: str = ""
+    
+    # Ingress limits (bytes / seconds)
+    max_body_bytes: int = 65536
+    contact_max_body_bytes: int = 16384
+    max_header_bytes: int = 8192
+    body_read_timeout: float = 10.0
+    
     # Application settings
     app_name: str = "Portfolio Contact API"
     app_version: str = "1.0.0"
@@ -0,0 +1,188 @@
+"""
+Ingress guard middleware.
+Rejects oversized, mistyped or slowly delivered request bodies before
+FastAPI buffers and decodes them.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """
+    Body limits applied to a single route path.
+
+    `content_types` lists the accepted media types; an empty tuple accepts
+    any. Requests without a Content-Type header are always accepted.
+    """
+
+    max_body_bytes: int
+    content_types: Tuple[str, ...] = ()
+
+
+class IngressRejected(Exception):
+    """Raised when a request violates the ingress policy."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class IngressGuardMiddleware:
+    """
+    Pure ASGI middleware enforcing request size, type and timing limits.
+
+    The request body is read here, chunk by chunk, under a byte cap and a
+    read deadline, then replayed to the wrapped application. Memory held
+    per request is therefore bounded by the route's cap, whatever the
+    client sends.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_max_body_bytes: int,
+        max_header_bytes: int,
+        body_timeout: float,
+        routes: Optional[Dict[str, RoutePolicy]] = None,
+    ):
+        """
+        Args:
+            app: Wrapped ASGI application
+            default_max_body_bytes: Body cap for paths without a policy
+            max_header_bytes: Cap on the combined size of request headers
+            body_timeout: Seconds allowed to receive the complete body
+            routes: Per-path policies, keyed by exact request path
+        """
+        self.app = app
+        self.default_policy = RoutePolicy(max_body_bytes=default_max_body_bytes)
+        self.max_header_bytes = max_header_bytes
+        self.body_timeout = body_timeout
+        self.routes = routes or {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.routes.get(scope["path"], self.default_policy)
+
+        try:
+            self._check_headers(scope, policy)
+            body = await self._read_body(receive, policy)
+        except IngressRejected as e:
+            logger.warning(
+                f"Rejected {scope['method']} {scope['path']}: "
+                f"{e.status_code} {e.detail}"
+            )
+            response = JSONResponse(
+                status_code=e.status_code,
+                content={"detail": e.detail},
+                headers={"Connection": "close"},
+            )
+            await response(scope, receive, send)
+            return
+
+        if body is None:
+            # Client went away before finishing the body; nobody to answer
+            return
+
+        await self.app(scope, self._replay(body, receive), send)
+
+    def _check_headers(self, scope: Scope, policy: RoutePolicy) -> None:
+        """Validate header size, declared length and content type."""
+        headers = scope["headers"]
+
+        header_bytes = sum(len(name) + len(value) for name, value in headers)
+        if header_bytes > self.max_header_bytes:
+            raise IngressRejected(431, "Request headers too large")
+
+        content_length = None
+        content_type = None
+        for name, value in headers:
+            if name == b"content-length":
+                content_length = value
+            elif name == b"content-type":
+                content_type = value
+
+        if content_length is not None:
+            try:
+                declared = int(content_length)
+            except ValueError:
+                raise IngressRejected(400, "Invalid Content-Length header")
+            if declared < 0:
+                raise IngressRejected(400, "Invalid Content-Length header")
+            if declared > policy.max_body_bytes:
+                raise IngressRejected(413, "Request body too large")
+
+        # A missing Content-Type is let through so FastAPI keeps deciding
+        # how to treat it, as it did before this guard existed
+        if (
+            policy.content_types
+            and scope["method"] in BODY_METHODS
+            and content_type is not None
+        ):
+            media_type = content_type.decode("latin-1").split(";")[0]
+            media_type = media_type.strip().lower()
+            if media_type not in policy.content_types:
+                raise IngressRejected(415, "Unsupported media type")
+
+    async def _read_body(
+        self, receive: Receive, policy: RoutePolicy
+    ) -> Optional[bytes]:
+        """
+        Receive the full body under the policy's byte cap and deadline.
+
+        Returns:
+            The body bytes, or None if the client disconnected mid-body
+        """
+        chunks = []
+        received = 0
+        deadline = time.monotonic() + self.body_timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IngressRejected(408, "Request body timeout")
+            try:
+                message = await asyncio.wait_for(receive(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise IngressRejected(408, "Request body timeout")
+
+            if message["type"] == "http.disconnect":
+                return None
+
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > policy.max_body_bytes:
+                raise IngressRejected(413, "Request body too large")
+            if chunk:
+                chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    def _replay(body: bytes, receive: Receive) -> Receive:
+        """Build a receive callable that yields the buffered body once."""
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return replay
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
+from app.core.ingress import IngressGuardMiddleware, RoutePolicy
 from app.api.v1.router import api_router
 from app.api.v1.endpoints.health import router as health_router
 
@@ -41,6 +42,21 @@ def create_application() -> FastAPI:
         version=settings.app_version,
     )
     
+    # Reject oversized, mistyped or slow request bodies before parsing.
+    # Added before CORS so that rejections still carry CORS headers.
+    app.add_middleware(
+        IngressGuardMiddleware,
+        default_max_body_bytes=settings.max_body_bytes,
+        max_header_bytes=settings.max_header_bytes,
+        body_timeout=settings.body_read_timeout,
+        routes={
+            "/api/v1/contact": RoutePolicy(
+                max_body_bytes=settings.contact_max_body_bytes,
+                content_types=("application/json",),
+            ),
+        },
+    )
+    
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -1,4 +1,5 @@
 """Schemas package."""
 from app.schemas.contact import ContactRequest, ContactResponse
+from app.schemas.stats import StatsResponse
 
-__all__ = ["ContactRequest", "ContactResponse"]
+__all__ = ["ContactRequest", "ContactResponse", "StatsResponse"]
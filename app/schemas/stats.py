@@ -0,0 +1,49 @@
+"""
+Pydantic schemas for submission statistics responses.
+"""
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class SubmissionCounts(BaseModel):
+    """Submission counts over sliding windows."""
+    
+    last_minute: int = Field(..., description="Submissions in the last minute")
+    last_hour: int = Field(..., description="Submissions in the last hour")
+    last_day: int = Field(..., description="Submissions in the last day")
+
+
+class DomainCount(BaseModel):
+    """Estimated submission count for a sender domain."""
+    
+    domain: str = Field(..., description="Sender email domain")
+    count: int = Field(..., description="Estimated number of submissions")
+
+
+class StatsResponse(BaseModel):
+    """Schema for contact form statistics."""
+    
+    submissions: SubmissionCounts = Field(
+        ..., 
+        description="Submission counts per minute, hour and day"
+    )
+    succeeded: int = Field(
+        ..., 
+        description="Submissions delivered since startup"
+    )
+    failed: int = Field(
+        ..., 
+        description="Submissions that failed since startup"
+    )
+    success_ratio: Optional[float] = Field(
+        None, 
+        description="Share of submissions delivered, null before any submission"
+    )
+    top_domains: List[DomainCount] = Field(
+        ..., 
+        description="Most frequent sender domains"
+    )
+    median_send_latency_ms: Optional[float] = Field(
+        None, 
+        description="Median SMTP send time over recent successful sends"
+    )
@@ -1,4 +1,5 @@
 """Services package."""
 from app.services.email import email_service
+from app.services.stats import stats_service
 
-__all__ = ["email_service"]
+__all__ = ["email_service", "stats_service"]
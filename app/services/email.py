@@ -2,12 +2,14 @@
 Email service module for sending contact form emails via Gmail SMTP.
 """
 import smtplib
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.services.stats import stats_service
 
 logger = get_logger(__name__)
 
@@ -155,10 +157,12 @@ class EmailService:
             # Connect to SMTP server and send email
             logger.info(f"Connecting to SMTP server: {self.smtp_host}:{self.smtp_port}")
             
+            started = time.perf_counter()
             with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
                 server.starttls()  # Secure the connection
                 server.login(self.sender_email, self.sender_password)
                 server.send_message(msg)
+            stats_service.record_send_latency(time.perf_counter() - started)
             
             logger.info(f"Email sent successfully to {self.recipient_email}")
             return True
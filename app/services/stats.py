@@ -0,0 +1,268 @@
+"""
+Submission statistics service.
+Keeps constant-memory, incrementally updated counters for the contact form.
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class RingCounter:
+    """
+    Sliding-window event counter backed by a fixed ring of time buckets.
+
+    The window spans `size * bucket_seconds`. One extra slot keeps the
+    bucket straddling the window start; its count is weighted by the part
+    still inside the window, so totals cover the full window rather than
+    stopping at the last bucket boundary. Stale buckets are lazily reset
+    when their slot is reused.
+    """
+
+    def __init__(self, size: int, bucket_seconds: int):
+        self.size = size
+        self.bucket_seconds = bucket_seconds
+        self._counts = [0] * (size + 1)
+        self._epochs = [-1] * (size + 1)
+
+    def add(self, now: float, amount: int = 1) -> None:
+        """Record `amount` events at time `now`."""
+        epoch = int(now // self.bucket_seconds)
+        index = epoch % len(self._counts)
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._counts[index] = 0
+        self._counts[index] += amount
+
+    def total(self, now: float) -> int:
+        """Return the estimated number of events in the window ending at `now`."""
+        position = now / self.bucket_seconds
+        current = int(position)
+        oldest = current - self.size
+        # Share of the oldest bucket that still falls inside the window
+        oldest_weight = 1 - (position - current)
+
+        total = 0.0
+        for count, epoch in zip(self._counts, self._epochs):
+            if epoch == oldest:
+                total += count * oldest_weight
+            elif oldest < epoch <= current:
+                total += count
+        return round(total)
+
+
+class _CountBucket:
+    """Stream-summary node grouping every key that shares one count."""
+
+    __slots__ = ("count", "keys", "prev", "next")
+
+    def __init__(self, count: int):
+        self.count = count
+        self.keys: Dict[str, None] = {}
+        self.prev: Optional["_CountBucket"] = None
+        self.next: Optional["_CountBucket"] = None
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters sketch holding at most `capacity` keys.
+
+    When a new key arrives and the table is full, a key with the smallest
+    counter is evicted and its count inherited, so frequent keys are never
+    lost. Counters live in the stream-summary layout: buckets of equal
+    count in a doubly linked list ordered by count, so the minimum is the
+    head and every update is O(1).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._bucket_of: Dict[str, _CountBucket] = {}
+        self._head: Optional[_CountBucket] = None
+        self._tail: Optional[_CountBucket] = None
+
+    def add(self, key: str) -> None:
+        """Count one occurrence of `key`."""
+        if key in self._bucket_of:
+            self._increment(key)
+            return
+
+        head = self._head
+        if len(self._bucket_of) < self.capacity:
+            if head is None or head.count != 1:
+                head = self._link_after(None, 1)
+            head.keys[key] = None
+            self._bucket_of[key] = head
+            return
+
+        # Take over a minimum key's counter, then count this occurrence
+        victim = next(iter(head.keys))
+        del head.keys[victim]
+        del self._bucket_of[victim]
+        head.keys[key] = None
+        self._bucket_of[key] = head
+        self._increment(key)
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """Return up to `n` keys with the highest estimated counts."""
+        ranked = []
+        bucket = self._tail
+        while bucket is not None and len(ranked) < n:
+            for key in bucket.keys:
+                ranked.append((key, bucket.count))
+                if len(ranked) == n:
+                    break
+            bucket = bucket.prev
+        return ranked
+
+    def _increment(self, key: str) -> None:
+        """Move `key` from its bucket to the bucket for count + 1."""
+        bucket = self._bucket_of[key]
+        target = bucket.next
+        if target is None or target.count != bucket.count + 1:
+            target = self._link_after(bucket, bucket.count + 1)
+
+        del bucket.keys[key]
+        target.keys[key] = None
+        self._bucket_of[key] = target
+        if not bucket.keys:
+            self._unlink(bucket)
+
+    def _link_after(
+        self, bucket: Optional[_CountBucket], count: int
+    ) -> _CountBucket:
+        """Insert a new bucket after `bucket`, or at the head when None."""
+        node = _CountBucket(count)
+        node.prev = bucket
+        node.next = self._head if bucket is None else bucket.next
+        if node.next is not None:
+            node.next.prev = node
+        else:
+            self._tail = node
+        if bucket is None:
+            self._head = node
+        else:
+            bucket.next = node
+        return node
+
+    def _unlink(self, bucket: _CountBucket) -> None:
+        """Remove an empty bucket from the list."""
+        if bucket.prev is not None:
+            bucket.prev.next = bucket.next
+        else:
+            self._head = bucket.next
+        if bucket.next is not None:
+            bucket.next.prev = bucket.prev
+        else:
+            self._tail = bucket.prev
+
+
+class StatsService:
+    """Service aggregating contact form submission statistics in process."""
+
+    def __init__(
+        self,
+        domain_capacity: int = 64,
+        latency_samples: int = 256,
+    ):
+        """
+        Initialize empty counters.
+
+        Args:
+            domain_capacity: Number of sender domains tracked by the sketch
+            latency_samples: Number of recent send latencies kept for the median
+        """
+        self._lock = threading.Lock()
+        self._per_minute = RingCounter(size=60, bucket_seconds=1)
+        self._per_hour = RingCounter(size=60, bucket_seconds=60)
+        self._per_day = RingCounter(size=24, bucket_seconds=3600)
+        self._domains = SpaceSaving(domain_capacity)
+        self._latencies = [0.0] * latency_samples
+        self._latency_count = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def record_submission(
+        self,
+        email: str,
+        success: bool,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Record a contact form submission.
+
+        Args:
+            email: Sender's email address
+            success: Whether the submission was delivered
+            now: Monotonic event time, defaults to time.monotonic()
+        """
+        # Monotonic time keeps buckets stable across wall-clock steps
+        now = time.monotonic() if now is None else now
+        domain = email.rpartition("@")[2].lower()
+
+        with self._lock:
+            self._per_minute.add(now)
+            self._per_hour.add(now)
+            self._per_day.add(now)
+            self._domains.add(domain)
+            if success:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+
+    def record_send_latency(self, seconds: float) -> None:
+        """
+        Record how long a successful email send took.
+
+        Args:
+            seconds: Send duration in seconds
+        """
+        with self._lock:
+            index = self._latency_count % len(self._latencies)
+            self._latencies[index] = seconds
+            self._latency_count += 1
+
+    def snapshot(self, top_domains: int = 10, now: Optional[float] = None) -> Dict:
+        """
+        Return the current statistics.
+
+        Args:
+            top_domains: Maximum number of sender domains to report
+            now: Monotonic reference time, defaults to time.monotonic()
+
+        Returns:
+            Dictionary matching the StatsResponse schema
+        """
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            total = self.succeeded + self.failed
+            filled = min(self._latency_count, len(self._latencies))
+            samples = sorted(self._latencies[:filled])
+
+            median_ms = None
+            if samples:
+                mid = filled // 2
+                if filled % 2:
+                    median = samples[mid]
+                else:
+                    median = (samples[mid - 1] + samples[mid]) / 2
+                median_ms = round(median * 1000, 2)
+
+            return {
+                "submissions": {
+                    "last_minute": self._per_minute.total(now),
+                    "last_hour": self._per_hour.total(now),
+                    "last_day": self._per_day.total(now),
+                },
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "success_ratio": self.succeeded / total if total else None,
+                "top_domains": [
+                    {"domain": domain, "count": count}
+                    for domain, count in self._domains.top(top_domains)
+                ],
+                "median_send_latency_ms": median_ms,
+            }
+
+
+# Create stats service instance
+stats_service = StatsService()
@@ -0,0 +1,107 @@
+"""
+Memory benchmark for the ingress guard under abusive clients.
+
+Simulates many concurrent clients streaming oversized, chunked bodies at
+the contact endpoint and reports peak traced memory for the application
+with and without the ingress guard installed.
+
+Usage:
+    python -m benchmarks.ingress_memory [--clients 50] [--body-kib 1024]
+"""
+import argparse
+import asyncio
+import os
+import tracemalloc
+
+os.environ.setdefault("TESTING", "true")
+
+from app.core.ingress import IngressGuardMiddleware
+from app.main import create_application
+
+CHUNK_SIZE = 64 * 1024
+# Shared payload so the simulated clients themselves allocate nothing
+CHUNK = b"x" * CHUNK_SIZE
+
+
+def abusive_receive(body_size: int):
+    """Build a receive callable streaming body_size bytes in chunks."""
+    remaining = body_size - body_size % CHUNK_SIZE
+
+    async def receive():
+        nonlocal remaining
+        if remaining <= 0:
+            return {"type": "http.disconnect"}
+        remaining -= CHUNK_SIZE
+        await asyncio.sleep(0)
+        return {
+            "type": "http.request",
+            "body": CHUNK,
+            "more_body": remaining > 0,
+        }
+
+    return receive
+
+
+async def drive(asgi_app, clients: int, body_size: int) -> None:
+    """Run all clients concurrently against asgi_app."""
+
+    async def send(message):
+        pass
+
+    async def one_client():
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/api/v1/contact",
+            "raw_path": b"/api/v1/contact",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"content-type", b"application/json")],
+            "client": ("127.0.0.1", 12345),
+            "server": ("127.0.0.1", 8000),
+        }
+        try:
+            await asgi_app(scope, abusive_receive(body_size), send)
+        except Exception:
+            # Server error middleware re-raises after responding
+            pass
+
+    await asyncio.gather(*(one_client() for _ in range(clients)))
+
+
+def measure(asgi_app, clients: int, body_size: int) -> int:
+    """Return peak traced memory in bytes for one simulation run."""
+    tracemalloc.start()
+    asyncio.run(drive(asgi_app, clients, body_size))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--body-kib", type=int, default=1024)
+    args = parser.parse_args()
+
+    body_size = args.body_kib * 1024
+    guarded = create_application()
+    unguarded = create_application()
+    unguarded.user_middleware = [
+        m for m in unguarded.user_middleware
+        if m.cls is not IngressGuardMiddleware
+    ]
+
+    unguarded_peak = measure(unguarded, args.clients, body_size)
+    guarded_peak = measure(guarded, args.clients, body_size)
+
+    print(f"clients={args.clients} body={args.body_kib} KiB each")
+    print(f"unguarded peak: {unguarded_peak / 1024 / 1024:8.2f} MiB")
+    print(f"guarded peak:   {guarded_peak / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
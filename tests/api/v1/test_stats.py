@@ -0,0 +1,77 @@
+"""
+Tests for stats endpoint.
+"""
+from unittest.mock import patch
+
+from app.services.stats import StatsService
+
+
+def test_stats_requires_configured_key(client):
+    """Test that the stats endpoint is disabled without a configured key."""
+    with patch("app.api.v1.endpoints.stats.settings") as mock_settings:
+        mock_settings.stats_api_key = ""
+        
+        response = client.get("/api/v1/stats", headers={"X-API-Key": "anything"})
+        
+        assert response.status_code == 503
+
+
+def test_stats_rejects_invalid_key(client):
+    """Test that a wrong or missing API key is rejected."""
+    with patch("app.api.v1.endpoints.stats.settings") as mock_settings:
+        mock_settings.stats_api_key = "secret"
+        
+        assert client.get("/api/v1/stats").status_code == 401
+        response = client.get("/api/v1/stats", headers={"X-API-Key": "wrong"})
+        assert response.status_code == 401
+
+
+def test_stats_rejects_non_ascii_key(client):
+    """Test that a non-ASCII API key is rejected rather than erroring."""
+    with patch("app.api.v1.endpoints.stats.settings") as mock_settings:
+        mock_settings.stats_api_key = "secret"
+        
+        response = client.get(
+            "/api/v1/stats",
+            headers={"X-API-Key": "s\xe9cret".encode("latin-1")},
+        )
+        
+        assert response.status_code == 401
+
+
+def test_stats_accepts_non_ascii_key(client):
+    """Test that a configured non-ASCII key works when sent as UTF-8."""
+    with patch("app.api.v1.endpoints.stats.settings") as mock_settings:
+        mock_settings.stats_api_key = "s\u00e9cret"
+        
+        response = client.get(
+            "/api/v1/stats",
+            headers={"X-API-Key": "s\u00e9cret".encode("utf-8")},
+        )
+        
+        assert response.status_code == 200
+
+
+def test_stats_counts_contact_submissions(client, sample_contact_data):
+    """Test that contact submissions are reflected in the stats."""
+    stats = StatsService()
+    with patch("app.api.v1.endpoints.stats.settings") as mock_settings, \
+         patch("app.api.v1.endpoints.stats.stats_service", stats), \
+         patch("app.api.v1.endpoints.contact.stats_service", stats), \
+         patch("app.api.v1.endpoints.contact.email_service") as mock_service:
+        mock_settings.stats_api_key = "secret"
+        mock_service.send_email.return_value = True
+        
+        client.post("/api/v1/contact", json=sample_contact_data)
+        mock_service.send_email.side_effect = Exception("SMTP connection failed")
+        client.post("/api/v1/contact", json=sample_contact_data)
+        
+        response = client.get("/api/v1/stats", headers={"X-API-Key": "secret"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["submissions"]["last_minute"] == 2
+        assert data["succeeded"] == 1
+        assert data["failed"] == 1
+        assert data["success_ratio"] == 0.5
+        assert data["top_domains"] == [{"domain": "example.com", "count": 2}]
@@ -0,0 +1,126 @@
+"""
+Tests for the ingress guard middleware.
+"""
+import asyncio
+import json
+
+from app.core.ingress import IngressGuardMiddleware, RoutePolicy
+
+
+def test_contact_rejects_wrong_content_type(client, sample_contact_data):
+    """Test that non-JSON bodies are rejected on the contact route."""
+    response = client.post(
+        "/api/v1/contact",
+        content=json.dumps(sample_contact_data),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 415
+
+
+def test_rejects_large_headers(client):
+    """Test that oversized request headers are rejected."""
+    response = client.get("/health", headers={"X-Padding": "a" * 10000})
+    assert response.status_code == 431
+
+
+def _run_guard(
+    messages,
+    policy,
+    body_timeout=1.0,
+    delay=0.0,
+    headers=((b"content-type", b"application/json"),),
+):
+    """Drive the middleware directly with a scripted receive channel."""
+    sent = []
+    reached_app = []
+    receive_calls = []
+    pending = list(messages)
+
+    async def app(scope, receive, send):
+        reached_app.append(await receive())
+
+    async def receive():
+        receive_calls.append(True)
+        if delay:
+            await asyncio.sleep(delay)
+        return pending.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    guard = IngressGuardMiddleware(
+        app,
+        default_max_body_bytes=policy.max_body_bytes,
+        max_header_bytes=8192,
+        body_timeout=body_timeout,
+        routes={"/upload": policy},
+    )
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/upload",
+        "headers": list(headers),
+    }
+    asyncio.run(guard(scope, receive, send))
+    return sent, reached_app, receive_calls
+
+
+def test_large_content_length_rejected_before_reading():
+    """Test that an oversized declared body is rejected without reading it."""
+    sent, reached_app, receive_calls = _run_guard(
+        [],
+        RoutePolicy(max_body_bytes=1000),
+        headers=[
+            (b"content-type", b"application/json"),
+            (b"content-length", b"20000"),
+        ],
+    )
+    assert sent[0]["status"] == 413
+    assert receive_calls == []
+    assert reached_app == []
+
+
+def test_streamed_body_over_cap_is_rejected():
+    """Test that chunked bodies without Content-Length are still capped."""
+    chunks = [
+        {"type": "http.request", "body": b"x" * 600, "more_body": True},
+        {"type": "http.request", "body": b"x" * 600, "more_body": False},
+    ]
+    sent, reached_app, _ = _run_guard(chunks, RoutePolicy(max_body_bytes=1000))
+    assert sent[0]["status"] == 413
+    assert reached_app == []
+
+
+def test_slow_body_times_out():
+    """Test that a client dribbling its body past the deadline gets a 408."""
+    chunks = [
+        {"type": "http.request", "body": b"x", "more_body": True}
+        for _ in range(10)
+    ]
+    sent, reached_app, _ = _run_guard(
+        chunks, RoutePolicy(max_body_bytes=1000), body_timeout=0.1, delay=0.05
+    )
+    assert sent[0]["status"] == 408
+    assert reached_app == []
+
+
+def test_body_is_replayed_to_app():
+    """Test that accepted bodies reach the application intact."""
+    chunks = [
+        {"type": "http.request", "body": b'{"a":', "more_body": True},
+        {"type": "http.request", "body": b" 1}", "more_body": False},
+    ]
+    sent, reached_app, _ = _run_guard(chunks, RoutePolicy(max_body_bytes=1000))
+    assert reached_app[0]["body"] == b'{"a": 1}'
+
+
+def test_missing_content_type_is_passed_through():
+    """Test that a body without Content-Type is left for FastAPI to judge."""
+    chunks = [{"type": "http.request", "body": b"{}", "more_body": False}]
+    sent, reached_app, _ = _run_guard(
+        chunks,
+        RoutePolicy(max_body_bytes=1000, content_types=("application/json",)),
+        headers=(),
+    )
+    assert sent == []
+    assert reached_app[0]["body"] == b"{}"
@@ -0,0 +1,84 @@
+"""
+Tests for the submission statistics service.
+"""
+from app.services.stats import RingCounter, SpaceSaving, StatsService
+
+
+def test_ring_counter_expires_old_buckets():
+    """Test that events fall out of the window as time advances."""
+    counter = RingCounter(size=60, bucket_seconds=1)
+    counter.add(1000.0)
+    counter.add(1030.0)
+    
+    assert counter.total(1030.0) == 2
+    assert counter.total(1070.0) == 1
+    assert counter.total(1100.0) == 0
+
+
+def test_ring_counter_reuses_slots():
+    """Test that a reused slot is reset before counting."""
+    counter = RingCounter(size=10, bucket_seconds=1)
+    # Ten buckets plus the straddling one: epochs 5 and 16 share a slot
+    counter.add(5.0)
+    counter.add(16.0)
+    
+    assert counter.total(16.0) == 1
+
+
+def test_ring_counter_weights_oldest_bucket():
+    """Test that the bucket straddling the window start is partly counted."""
+    counter = RingCounter(size=2, bucket_seconds=10)
+    counter.add(5.0, amount=4)
+    counter.add(15.0)
+    counter.add(25.0)
+    
+    # Window is [5, 25]: half of the first bucket is still inside it
+    assert counter.total(25.0) == 4
+    assert counter.total(30.0) == 2
+
+
+def test_space_saving_keeps_heavy_hitters():
+    """Test that frequent keys survive eviction of rare ones."""
+    sketch = SpaceSaving(capacity=3)
+    for _ in range(50):
+        sketch.add("gmail.com")
+    for i in range(100):
+        sketch.add(f"rare{i}.com")
+    
+    top_domain, count = sketch.top(1)[0]
+    assert top_domain == "gmail.com"
+    assert count >= 50
+    assert len(sketch.top(10)) == 3
+
+
+def test_snapshot_aggregates_submissions():
+    """Test windowed counts, outcomes, domains and median latency."""
+    stats = StatsService(domain_capacity=8, latency_samples=4)
+    stats.record_submission("a@Example.com", success=True, now=10.0)
+    stats.record_submission("b@example.com", success=True, now=3000.0)
+    stats.record_submission("c@other.org", success=False, now=3690.0)
+    for seconds in (0.1, 0.2, 0.3, 0.4, 0.5, 0.9):
+        stats.record_send_latency(seconds)
+    
+    snapshot = stats.snapshot(now=3700.0)
+    
+    assert snapshot["submissions"] == {
+        "last_minute": 1,
+        "last_hour": 2,
+        "last_day": 3,
+    }
+    assert snapshot["succeeded"] == 2
+    assert snapshot["failed"] == 1
+    assert snapshot["success_ratio"] == 2 / 3
+    assert snapshot["top_domains"][0] == {"domain": "example.com", "count": 2}
+    # Only the last four samples are kept: 0.3, 0.4, 0.5, 0.9
+    assert snapshot["median_send_latency_ms"] == 450.0
+
+
+def test_snapshot_empty():
+    """Test the snapshot before any events."""
+    snapshot = StatsService().snapshot(now=0.0)
+    
+    assert snapshot["success_ratio"] is None
+    assert snapshot["median_send_latency_ms"] is None
+    assert snapshot["top_domains"] == []